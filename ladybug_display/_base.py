@@ -2,6 +2,11 @@
 """Base class for all geometry objects."""
 LINE_TYPES = ('Continuous', 'Dashed', 'Dotted', 'DashDot')
 DISPLAY_MODES = ('Surface', 'SurfaceWithEdges', 'Wireframe', 'Points')
+# lookup tables from canonical or lowercase text to the shared canonical string
+_LINE_TYPES_LOOKUP = {key: key for key in LINE_TYPES}
+_LINE_TYPES_LOOKUP.update({key.lower(): key for key in LINE_TYPES})
+_DISPLAY_MODES_LOOKUP = {key: key for key in DISPLAY_MODES}
+_DISPLAY_MODES_LOOKUP.update({key.lower(): key for key in DISPLAY_MODES})
 
 
 class _DisplayBase(object):
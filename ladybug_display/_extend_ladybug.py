@@ -1,4 +1,6 @@
 # coding=utf-8
+import importlib
+
 # import the core ladybug modules
 from ladybug.compass import Compass
 from ladybug.viewsphere import ViewSphere
@@ -9,25 +11,45 @@ from ladybug.hourlyplot import HourlyPlot
 from ladybug.monthlychart import MonthlyChart
 from ladybug.psychchart import PsychrometricChart
 
-# import the extension functions
-from .extension.compass import compass_to_vis_set
-from .extension.viewsphere import view_sphere_to_vis_set
-from .extension.sunpath import sunpath_to_vis_set
-from .extension.windrose import wind_rose_to_vis_set
-from .extension.windprofile import wind_profile_to_vis_set
-from .extension.hourlyplot import hourly_plot_to_vis_set
-from .extension.monthlychart import monthly_chart_to_vis_set
-from .extension.psychchart import psychrometric_chart_to_vis_set
+
+class _LazyMethod(object):
+    """Descriptor that imports an extension function the first time it is accessed.
+
+    Once imported, the function replaces this descriptor on the class such that
+    the extension modules are only loaded when a to_vis_set method is used.
+
+    Args:
+        module_name: Text for the name of the module within ladybug_display.extension
+            that contains the function.
+        function_name: Text for the name of the function within the module.
+        method_name: Text for the name of the method on the class.
+            (Default: to_vis_set).
+    """
+    __slots__ = ('module_name', 'function_name', 'method_name')
+
+    def __init__(self, module_name, function_name, method_name='to_vis_set'):
+        self.module_name = module_name
+        self.function_name = function_name
+        self.method_name = method_name
+
+    def __get__(self, obj, cls):
+        module = importlib.import_module(
+            'ladybug_display.extension.{}'.format(self.module_name))
+        func = getattr(module, self.function_name)
+        setattr(cls, self.method_name, func)
+        return func.__get__(obj, cls)
+
 
 # inject the methods onto the classes
-Compass.to_vis_set = compass_to_vis_set
-ViewSphere.to_vis_set = view_sphere_to_vis_set
-Sunpath.to_vis_set = sunpath_to_vis_set
-WindRose.to_vis_set = wind_rose_to_vis_set
-WindProfile.to_vis_set = wind_profile_to_vis_set
-HourlyPlot.to_vis_set = hourly_plot_to_vis_set
-MonthlyChart.to_vis_set = monthly_chart_to_vis_set
-PsychrometricChart.to_vis_set = psychrometric_chart_to_vis_set
+Compass.to_vis_set = _LazyMethod('compass', 'compass_to_vis_set')
+ViewSphere.to_vis_set = _LazyMethod('viewsphere', 'view_sphere_to_vis_set')
+Sunpath.to_vis_set = _LazyMethod('sunpath', 'sunpath_to_vis_set')
+WindRose.to_vis_set = _LazyMethod('windrose', 'wind_rose_to_vis_set')
+WindProfile.to_vis_set = _LazyMethod('windprofile', 'wind_profile_to_vis_set')
+HourlyPlot.to_vis_set = _LazyMethod('hourlyplot', 'hourly_plot_to_vis_set')
+MonthlyChart.to_vis_set = _LazyMethod('monthlychart', 'monthly_chart_to_vis_set')
+PsychrometricChart.to_vis_set = \
+    _LazyMethod('psychchart', 'psychrometric_chart_to_vis_set')
 
 # try to extend ladybug-radiance
 try:
@@ -38,19 +60,14 @@ try:
     from ladybug_radiance.study.directsun import DirectSunStudy
     from ladybug_radiance.study.radiation import RadiationStudy
 
-    # import the extension functions
-    from .extension.skydome import sky_dome_to_vis_set
-    from .extension.radrose import radiation_rose_to_vis_set
-    from .extension.raddome import radiation_dome_to_vis_set
-    from .extension.study.directsun import direct_sun_study_to_vis_set
-    from .extension.study.radiation import radiation_study_to_vis_set
-
     # inject the methods onto the classes
-    SkyDome.to_vis_set = sky_dome_to_vis_set
-    RadiationRose.to_vis_set = radiation_rose_to_vis_set
-    RadiationDome.to_vis_set = radiation_dome_to_vis_set
-    DirectSunStudy.to_vis_set = direct_sun_study_to_vis_set
-    RadiationStudy.to_vis_set = radiation_study_to_vis_set
+    SkyDome.to_vis_set = _LazyMethod('skydome', 'sky_dome_to_vis_set')
+    RadiationRose.to_vis_set = _LazyMethod('radrose', 'radiation_rose_to_vis_set')
+    RadiationDome.to_vis_set = _LazyMethod('raddome', 'radiation_dome_to_vis_set')
+    DirectSunStudy.to_vis_set = \
+        _LazyMethod('study.directsun', 'direct_sun_study_to_vis_set')
+    RadiationStudy.to_vis_set = \
+        _LazyMethod('study.radiation', 'radiation_study_to_vis_set')
 except ImportError:
     pass  # ladybug-radiance is not installed
 
@@ -59,10 +76,7 @@ try:
     # import the ladybug-comfort modules
     from ladybug_comfort.chart.adaptive import AdaptiveChart
 
-    # import the extension functions
-    from .extension.adaptivechart import adaptive_chart_to_vis_set
-
     # inject the methods onto the classes
-    AdaptiveChart.to_vis_set = adaptive_chart_to_vis_set
+    AdaptiveChart.to_vis_set = _LazyMethod('adaptivechart', 'adaptive_chart_to_vis_set')
 except ImportError:
-    pass  # ladybug-radiance is not installed
+    pass  # ladybug-comfort is not installed
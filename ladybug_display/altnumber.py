@@ -31,7 +31,10 @@ class _AltNumber(object):
 class Default(_AltNumber):
     """Object to signify when the default value of a visual interface should be used."""
     __slots__ = ()
-    pass
+
+    def __reduce__(self):
+        # ensure that copies and pickles resolve to the module-level singleton
+        return 'default'
 
 
 default = Default()
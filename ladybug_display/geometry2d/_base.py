@@ -4,7 +4,8 @@ import math
 
 from ladybug.color import Color
 
-from ladybug_display._base import _DisplayBase, LINE_TYPES, DISPLAY_MODES
+from ladybug_display._base import _DisplayBase, _LINE_TYPES_LOOKUP, \
+    _DISPLAY_MODES_LOOKUP, LINE_TYPES, DISPLAY_MODES
 from ladybug_display.altnumber import default
 from ladybug_display.typing import float_positive
 
@@ -21,10 +22,6 @@ class _DisplayBase2D(_DisplayBase):
     """
     __slots__ = ()
 
-    def __init__(self, geometry):
-        """Initialize base with shade object."""
-        _DisplayBase.__init__(self, geometry)
-
     def move(self, moving_vec):
         """Move this geometry along a vector.
 
@@ -32,7 +29,7 @@ class _DisplayBase2D(_DisplayBase):
             moving_vec: A ladybug_geometry Vector with the direction and distance
                 to move the geometry.
         """
-        self._geometry = self.geometry.move(moving_vec)
+        self._geometry = self._geometry.move(moving_vec)
 
     def rotate(self, angle, origin):
         """Rotate this geometry counterclockwise by a certain angle.
@@ -42,7 +39,25 @@ class _DisplayBase2D(_DisplayBase):
             origin: A Point2D for the origin around which the line segment will
                 be rotated.
         """
-        self._geometry = self.geometry.rotate(math.radians(angle), origin)
+        self._geometry = self._geometry.rotate(math.radians(angle), origin)
+
+    @staticmethod
+    def rotate_many(display_objects, angle, origin):
+        """Rotate several display objects counterclockwise by the same angle.
+
+        This is faster than calling rotate on each object since the angle is
+        only converted to radians once.
+
+        Args:
+            display_objects: A list of 2D ladybug-display geometry objects to
+                be rotated.
+            angle: An angle for rotation in degrees.
+            origin: A Point2D for the origin around which the objects will
+                be rotated.
+        """
+        rad_angle = math.radians(angle)
+        for obj in display_objects:
+            obj._geometry = obj._geometry.rotate(rad_angle, origin)
 
     def reflect(self, normal, origin):
         """Reflect this geometry across a plane defined by a normal and origin.
@@ -52,7 +67,7 @@ class _DisplayBase2D(_DisplayBase):
                 which the line segment will be reflected. THIS VECTOR MUST BE NORMALIZED.
             origin: A Point2D representing the origin from which to reflect.
         """
-        self._geometry = self.geometry.reflect(normal, origin)
+        self._geometry = self._geometry.reflect(normal, origin)
 
     def scale(self, factor, origin=None):
         """Scale this geometry by a factor from an origin point.
@@ -62,7 +77,7 @@ class _DisplayBase2D(_DisplayBase):
             origin: A ladybug_geometry Point representing the origin from which
                 to scale. If None, it will be scaled from the World origin.
         """
-        self._geometry = self.geometry.scale(factor, origin)
+        self._geometry = self._geometry.scale(factor, origin)
 
     def __repr__(self):
         return 'Ladybug Display 2D Base Object'
@@ -85,7 +100,7 @@ class _SingleColorBase2D(_DisplayBase2D):
 
     def __init__(self, geometry, color=None):
         """Initialize base with shade object."""
-        _DisplayBase2D.__init__(self, geometry)
+        _DisplayBase.__init__(self, geometry)
         self.color = color
 
     @property
@@ -133,16 +148,13 @@ class _SingleColorModeBase2D(_SingleColorBase2D):
 
     @display_mode.setter
     def display_mode(self, value):
-        clean_input = value.lower()
-        for key in DISPLAY_MODES:
-            if key.lower() == clean_input:
-                value = key
-                break
-        else:
+        clean_value = _DISPLAY_MODES_LOOKUP.get(value) or \
+            _DISPLAY_MODES_LOOKUP.get(value.lower())
+        if clean_value is None:
             raise ValueError(
                 'display_mode {} is not recognized.\nChoose from the '
                 'following:\n{}'.format(value, DISPLAY_MODES))
-        self._display_mode = value
+        self._display_mode = clean_value
 
 
 class _LineCurveBase2D(_SingleColorBase2D):
@@ -187,7 +199,7 @@ class _LineCurveBase2D(_SingleColorBase2D):
 
     @line_width.setter
     def line_width(self, value):
-        if value == default:
+        if value is default:
             self._line_width = default
         else:
             self._line_width = float_positive(value, 'line width')
@@ -199,13 +211,10 @@ class _LineCurveBase2D(_SingleColorBase2D):
 
     @line_type.setter
     def line_type(self, value):
-        clean_input = value.lower()
-        for key in LINE_TYPES:
-            if key.lower() == clean_input:
-                value = key
-                break
-        else:
+        clean_value = _LINE_TYPES_LOOKUP.get(value) or \
+            _LINE_TYPES_LOOKUP.get(value.lower())
+        if clean_value is None:
             raise ValueError(
                 'line_type {} is not recognized.\nChoose from the '
                 'following:\n{}'.format(value, LINE_TYPES))
-        self._line_type = value
+        self._line_type = clean_value
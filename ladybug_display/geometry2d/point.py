@@ -60,7 +60,7 @@ class DisplayPoint2D(_SingleColorBase2D):
 
     @radius.setter
     def radius(self, value):
-        if value == default:
+        if value is default:
             self._radius = default
         else:
             self._radius = float_positive(value, 'point radius')
@@ -84,7 +84,7 @@ class DisplayPoint2D(_SingleColorBase2D):
         base = {'type': 'DisplayPoint2D'}
         base['geometry'] = self._geometry.to_dict()
         base['color'] = self.color.to_dict()
-        base['radius'] = default.to_dict() if self.radius == default else self.radius
+        base['radius'] = default.to_dict() if self.radius is default else self.radius
         if self.user_data is not None:
             base['user_data'] = self.user_data
         return base
@@ -100,7 +100,7 @@ class DisplayVector2D(_DisplayBase):
             axis: A ladybug_geometry Vector2D axis representing the axis of rotation.
             angle: An angle for rotation in degrees.
         """
-        self._geometry = self.geometry.rotate(math.radians(angle))
+        self._geometry = self._geometry.rotate(math.radians(angle))
 
     def reflect(self, normal):
         """Reflect this geometry across a plane with the input normal vector.
@@ -109,7 +109,7 @@ class DisplayVector2D(_DisplayBase):
             normal: A Vector2D representing the normal vector for the plane across
                 which the vector will be reflected. THIS VECTOR MUST BE NORMALIZED.
         """
-        self._geometry = self.geometry.reflect(normal)
+        self._geometry = self._geometry.reflect(normal)
 
     def to_dict(self):
         """Return DisplayVector2D as a dictionary.
@@ -4,7 +4,8 @@ import math
 
 from ladybug.color import Color
 
-from ladybug_display._base import _DisplayBase, DISPLAY_MODES, LINE_TYPES
+from ladybug_display._base import _DisplayBase, _LINE_TYPES_LOOKUP, \
+    _DISPLAY_MODES_LOOKUP, LINE_TYPES, DISPLAY_MODES
 from ladybug_display.altnumber import default
 from ladybug_display.typing import float_positive
 
@@ -21,10 +22,6 @@ class _DisplayBase3D(_DisplayBase):
     """
     __slots__ = ()
 
-    def __init__(self, geometry):
-        """Initialize base with shade object."""
-        _DisplayBase.__init__(self, geometry)
-
     def move(self, moving_vec):
         """Move this geometry along a vector.
 
@@ -32,7 +29,7 @@ class _DisplayBase3D(_DisplayBase):
             moving_vec: A ladybug_geometry Vector with the direction and distance
                 to move the geometry.
         """
-        self._geometry = self.geometry.move(moving_vec)
+        self._geometry = self._geometry.move(moving_vec)
 
     def rotate(self, axis, angle, origin):
         """Rotate this geometry by a certain angle around an axis and origin.
@@ -43,7 +40,26 @@ class _DisplayBase3D(_DisplayBase):
             origin: A ladybug_geometry Point3D for the origin around which the
                 object will be rotated.
         """
-        self._geometry = self.geometry.rotate(axis, math.radians(angle), origin)
+        self._geometry = self._geometry.rotate(axis, math.radians(angle), origin)
+
+    @staticmethod
+    def rotate_many(display_objects, axis, angle, origin):
+        """Rotate several display objects by the same angle around an axis and origin.
+
+        This is faster than calling rotate on each object since the angle is
+        only converted to radians once.
+
+        Args:
+            display_objects: A list of 3D ladybug-display geometry objects to
+                be rotated.
+            axis: A ladybug_geometry Vector3D axis representing the axis of rotation.
+            angle: An angle for rotation in degrees.
+            origin: A ladybug_geometry Point3D for the origin around which the
+                objects will be rotated.
+        """
+        rad_angle = math.radians(angle)
+        for obj in display_objects:
+            obj._geometry = obj._geometry.rotate(axis, rad_angle, origin)
 
     def rotate_xy(self, angle, origin):
         """Rotate this geometry counterclockwise in the world XY plane by an angle.
@@ -53,7 +69,7 @@ class _DisplayBase3D(_DisplayBase):
             origin: A ladybug_geometry Point3D for the origin around which the
                 object will be rotated.
         """
-        self._geometry = self.geometry.rotate_xy(math.radians(angle), origin)
+        self._geometry = self._geometry.rotate_xy(math.radians(angle), origin)
 
     def reflect(self, plane):
         """Reflect this geometry across a plane.
@@ -62,7 +78,7 @@ class _DisplayBase3D(_DisplayBase):
             plane: A ladybug_geometry Plane across which the object will
                 be reflected.
         """
-        self._geometry = self.geometry.reflect(plane.n, plane.o)
+        self._geometry = self._geometry.reflect(plane.n, plane.o)
 
     def scale(self, factor, origin=None):
         """Scale this geometry by a factor from an origin point.
@@ -72,7 +88,7 @@ class _DisplayBase3D(_DisplayBase):
             origin: A ladybug_geometry Point representing the origin from which
                 to scale. If None, it will be scaled from the World origin.
         """
-        self._geometry = self.geometry.scale(factor, origin)
+        self._geometry = self._geometry.scale(factor, origin)
 
     def __repr__(self):
         return 'Ladybug Display 3D Base Object'
@@ -95,7 +111,7 @@ class _SingleColorBase3D(_DisplayBase3D):
 
     def __init__(self, geometry, color=None):
         """Initialize base with shade object."""
-        _DisplayBase3D.__init__(self, geometry)
+        _DisplayBase.__init__(self, geometry)
         self.color = color
 
     @property
@@ -143,16 +159,13 @@ class _SingleColorModeBase3D(_SingleColorBase3D):
 
     @display_mode.setter
     def display_mode(self, value):
-        clean_input = value.lower()
-        for key in DISPLAY_MODES:
-            if key.lower() == clean_input:
-                value = key
-                break
-        else:
+        clean_value = _DISPLAY_MODES_LOOKUP.get(value) or \
+            _DISPLAY_MODES_LOOKUP.get(value.lower())
+        if clean_value is None:
             raise ValueError(
                 'display_mode {} is not recognized.\nChoose from the '
                 'following:\n{}'.format(value, DISPLAY_MODES))
-        self._display_mode = value
+        self._display_mode = clean_value
 
 
 class _LineCurveBase3D(_SingleColorBase3D):
@@ -197,7 +210,7 @@ class _LineCurveBase3D(_SingleColorBase3D):
 
     @line_width.setter
     def line_width(self, value):
-        if value == default:
+        if value is default:
             self._line_width = default
         else:
             self._line_width = float_positive(value, 'line width')
@@ -209,13 +222,10 @@ class _LineCurveBase3D(_SingleColorBase3D):
 
     @line_type.setter
     def line_type(self, value):
-        clean_input = value.lower()
-        for key in LINE_TYPES:
-            if key.lower() == clean_input:
-                value = key
-                break
-        else:
+        clean_value = _LINE_TYPES_LOOKUP.get(value) or \
+            _LINE_TYPES_LOOKUP.get(value.lower())
+        if clean_value is None:
             raise ValueError(
                 'line_type {} is not recognized.\nChoose from the '
                 'following:\n{}'.format(value, LINE_TYPES))
-        self._line_type = value
+        self._line_type = clean_value
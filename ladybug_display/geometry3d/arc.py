@@ -117,7 +117,7 @@ class DisplayArc3D(_LineCurveBase3D):
         base['geometry'] = self._geometry.to_dict()
         base['color'] = self.color.to_dict()
         base['line_width'] = default.to_dict() if \
-            self.line_width == default else self.line_width
+            self.line_width is default else self.line_width
         base['line_type'] = self.line_type
         if self.user_data is not None:
             base['user_data'] = self.user_data
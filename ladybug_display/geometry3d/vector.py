@@ -110,7 +110,7 @@ class DisplayVector3D(_DisplayBase):
             axis: A ladybug_geometry Vector3D axis representing the axis of rotation.
             angle: An angle for rotation in degrees.
         """
-        self._geometry = self.geometry.rotate(axis, math.radians(angle))
+        self._geometry = self._geometry.rotate(axis, math.radians(angle))
 
     def rotate_xy(self, angle):
         """Rotate this geometry counterclockwise in the world XY plane by an angle.
@@ -118,7 +118,7 @@ class DisplayVector3D(_DisplayBase):
         Args:
             angle: An angle in degrees.
         """
-        self._geometry = self.geometry.rotate_xy(math.radians(angle))
+        self._geometry = self._geometry.rotate_xy(math.radians(angle))
 
     def reflect(self, normal):
         """Reflect this geometry across a plane with the input normal vector.
@@ -127,7 +127,7 @@ class DisplayVector3D(_DisplayBase):
             normal: A Vector3D representing the normal vector for the plane across
                 which the vector will be reflected. THIS VECTOR MUST BE NORMALIZED.
         """
-        self._geometry = self.geometry.reflect(normal)
+        self._geometry = self._geometry.reflect(normal)
 
     def to_dict(self):
         """Return DisplayVector3D as a dictionary.
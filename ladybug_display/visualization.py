@@ -27,7 +27,7 @@ from .geometry3d import DisplayVector3D, DisplayPoint3D, \
 from ladybug_geometry.bounding import bounding_box
 from ladybug_geometry.dictutil import geometry_dict_to_object
 
-from ._base import DISPLAY_MODES
+from ._base import DISPLAY_MODES, _DISPLAY_MODES_LOOKUP
 from .geometry2d._base import _DisplayBase2D
 from .geometry3d._base import _DisplayBase3D
 from .typing import int_in_range, valid_string
@@ -1014,16 +1014,13 @@ class AnalysisGeometry(_VisualizationBase):
 
     @display_mode.setter
     def display_mode(self, value):
-        clean_input = value.lower()
-        for key in DISPLAY_MODES:
-            if key.lower() == clean_input:
-                value = key
-                break
-        else:
+        clean_value = _DISPLAY_MODES_LOOKUP.get(value) or \
+            _DISPLAY_MODES_LOOKUP.get(value.lower())
+        if clean_value is None:
             raise ValueError(
                 'display_mode {} is not recognized.\nChoose from the '
                 'following:\n{}'.format(value, DISPLAY_MODES))
-        self._display_mode = value
+        self._display_mode = clean_value
 
     @property
     def hidden(self):
@@ -0,0 +1,12 @@
+# coding=utf-8
+import copy
+import pickle
+
+from ladybug_display.altnumber import default
+
+
+def test_default_singleton():
+    """Test that copies of the default object resolve to the same singleton."""
+    assert copy.copy(default) is default
+    assert copy.deepcopy(default) is default
+    assert pickle.loads(pickle.dumps(default)) is default
@@ -1,8 +1,11 @@
 # coding=utf-8
+import pytest
+
 from ladybug_geometry.geometry3d.pointvector import Point3D, Vector3D
 from ladybug_geometry.geometry3d.cylinder import Cylinder
 from ladybug.color import Color
 from ladybug_display.geometry3d.cylinder import DisplayCylinder
+from ladybug_display._base import DISPLAY_MODES
 
 
 def test_cylinder_init():
@@ -13,6 +16,7 @@ def test_cylinder_init():
     radius = 0.7
     c = DisplayCylinder(Cylinder(center, axis, radius), grey)
     str(c)  # test the string representation of the cylinder
+    assert not hasattr(c, '__dict__')
 
     assert c.color == grey
     assert c.display_mode == 'Surface'
@@ -41,3 +45,14 @@ def test_cylinder_to_from_dict():
     new_c = DisplayCylinder.from_dict(con_d)
     assert isinstance(new_c, DisplayCylinder)
     assert new_c.to_dict() == con_d
+
+
+def test_cylinder_display_mode_canonical():
+    """Test that display_mode always references the canonical DISPLAY_MODES string."""
+    c = DisplayCylinder(Cylinder(Point3D(2, 0, 2), Vector3D(0, 2, 2), 0.7))
+    c.display_mode = 'WIREFRAME'
+    assert c.display_mode is DISPLAY_MODES[2]
+    c.display_mode = ''.join(['Poi', 'nts'])
+    assert c.display_mode is DISPLAY_MODES[3]
+    with pytest.raises(ValueError):
+        c.display_mode = 'Hologram'
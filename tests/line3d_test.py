@@ -43,3 +43,17 @@ def test_linesegment3_to_from_dict():
     new_seg = DisplayLineSegment3D.from_dict(seg_dict)
     assert isinstance(new_seg, DisplayLineSegment3D)
     assert new_seg.to_dict() == seg_dict
+
+
+def test_linesegment3d_rotate_many():
+    """Test that rotate_many matches rotating each DisplayLineSegment3D."""
+    axis, origin = Vector3D(0, 0, 1), Point3D(0, 0, 0)
+    segs = [DisplayLineSegment3D(LineSegment3D(Point3D(i, 0, 2), Vector3D(0, 2, 0)))
+            for i in range(3)]
+    rot_segs = [seg.duplicate() for seg in segs]
+    for seg in segs:
+        seg.rotate(axis, 90, origin)
+    DisplayLineSegment3D.rotate_many(rot_segs, axis, 90, origin)
+    for seg, rot_seg in zip(segs, rot_segs):
+        assert seg.p1.is_equivalent(rot_seg.p1, 1e-6)
+        assert seg.p2.is_equivalent(rot_seg.p2, 1e-6)
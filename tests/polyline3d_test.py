@@ -1,10 +1,13 @@
 # coding=utf-8
+import pytest
+
 from ladybug_geometry.geometry3d.pointvector import Point3D
 from ladybug_geometry.geometry3d.line import LineSegment3D
 from ladybug_geometry.geometry3d.polyline import Polyline3D
 from ladybug.color import Color
 from ladybug_display.geometry3d.polyline import DisplayPolyline3D
 from ladybug_display.altnumber import default
+from ladybug_display._base import LINE_TYPES
 
 
 def test_display_polyline3d_init():
@@ -13,6 +16,7 @@ def test_display_polyline3d_init():
     pts = (Point3D(0, 0), Point3D(2, 0), Point3D(2, 2), Point3D(0, 2))
     pline = DisplayPolyline3D(Polyline3D(pts), grey)
     str(pline)  # test the string representation of the polyline
+    assert not hasattr(pline, '__dict__')
 
     assert pline.color == grey
     assert pline.line_width == default
@@ -53,3 +57,15 @@ def test_polyline3d_to_from_dict():
     new_pline = DisplayPolyline3D.from_dict(pline_dict)
     assert isinstance(new_pline, DisplayPolyline3D)
     assert new_pline.to_dict() == pline_dict
+
+
+def test_display_polyline3d_line_type_canonical():
+    """Test that line_type always references the canonical LINE_TYPES string."""
+    pts = (Point3D(0, 0), Point3D(2, 0), Point3D(2, 2), Point3D(0, 2))
+    pline = DisplayPolyline3D(Polyline3D(pts))
+    pline.line_type = 'dashdot'
+    assert pline.line_type is LINE_TYPES[3]
+    pline.line_type = ''.join(['Das', 'hed'])
+    assert pline.line_type is LINE_TYPES[1]
+    with pytest.raises(ValueError):
+        pline.line_type = 'Squiggly'